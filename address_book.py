@@ -13,9 +13,18 @@ find, and delete records.
 
 """
 
-from collections import UserDict
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 import pickle
+import re
+import sys
+
+_PHONE_RE = re.compile(r"\d{10}\Z")
+_BDAY_FMT = "%d.%m.%Y"
+_NAME_KEY = "name"
+_DATE_KEY = "congratulation_date"
 
 
 class Field:
@@ -26,6 +35,8 @@ class Field:
         value (str): The value of the field.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         """
         Initializes the field with the given value.
@@ -35,6 +46,13 @@ class Field:
         """
         self.value = value
 
+    def __setstate__(self, state):
+        # Pickles written before __slots__ carry a plain instance dict
+        if isinstance(state, tuple):
+            state = state[1]
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def __str__(self):
         return str(self.value)
 
@@ -42,6 +60,8 @@ class Field:
 class Name(Field):
     """Represents a name field inheriting from the generic Field class."""
 
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
         if not name:
@@ -56,6 +76,8 @@ class Phone(Field):
         phone_number (str): The phone number value.
     """
 
+    __slots__ = ("_padded15",)
+
     def __init__(self, phone_number):
         """
         Initializes the phone field with the given phone number and validates it.
@@ -65,6 +87,8 @@ class Phone(Field):
         """
         super().__init__(phone_number)
         self.__validate(phone_number)
+        # Pre-padded for the "<15" column used by show_all
+        self._padded15 = phone_number.ljust(15)
 
     def __validate(self, phone_number):
         """
@@ -76,27 +100,49 @@ class Phone(Field):
         Raises:
             ValueError: If the phone number is not valid.
         """
-        if not phone_number.isdigit() or len(phone_number) != 10:
+        if not _PHONE_RE.match(phone_number):
             raise ValueError("Phone number must contain exactly 10 digits")
 
     def __format__(self, format_spec: str) -> str:
+        if format_spec == "<15":
+            return self._padded15
         return self.value.__format__(format_spec)
 
 
+@lru_cache(maxsize=4096)
+def _phone(phone_number):
+    """
+    Returns a cached Phone instance for the given number.
+
+    Phone objects are shared between records, so their value must not be mutated.
+    """
+    return Phone(phone_number)
+
+
 class Birthday(Field):
     """
     Represents a birthday in DD.MM.YYYY format. Contains validation
+
+    Attributes:
+        month (int): The birthday month, kept for fast date-free comparisons.
+        day (int): The birthday day of month.
     """
 
+    __slots__ = ("month", "day")
+
     def __init__(self, value):
         """
-        validates format and check if ensures that birthday is a date format
+        validates format and check if ensures that birthday is a date format.
+        A date object is taken as is, e.g. when restoring a pickled record.
         """
-        try:
-            value = datetime.strptime(value, "%d.%m.%Y").date()
-            super().__init__(value)
-        except ValueError as exc:
-            raise ValueError("Invalid date format. Use DD.MM.YYYY") from exc
+        if not isinstance(value, date):
+            try:
+                value = datetime.strptime(value, _BDAY_FMT).date()
+            except ValueError as exc:
+                raise ValueError("Invalid date format. Use DD.MM.YYYY") from exc
+        super().__init__(value)
+        self.month = value.month
+        self.day = value.day
 
 
 class Record:
@@ -105,9 +151,18 @@ class Record:
 
     Attributes:
         name (Name): The name of the contact.
-        phones (list of Phone): List of phone numbers associated with the contact.
+        phones (dict_values of Phone): Phone numbers associated with the contact.
+
+    Phones are kept in two dicts: number -> slot id for O(1) lookups, and
+    slot id -> Phone for display order. An edit reassigns the slot, so the
+    number keeps its position.
     """
 
+    __slots__ = ("name", "_phones", "_slots", "_next_slot", "__birthday")
+
+    # Bumped on every birthday change so AddressBook knows its index is stale
+    _birthday_changes = 0
+
     def __init__(self, name):
         """
         Initializes a record with the given name.
@@ -116,7 +171,9 @@ class Record:
             name (str): The name of the contact.
         """
         self.name = Name(name)
-        self.phones = []
+        self._phones = {}
+        self._slots = {}
+        self._next_slot = 0
         self.__birthday = None
 
     def add_birthday(self, birthday):
@@ -127,6 +184,7 @@ class Record:
             birthday (str): The birthday to add in DD.MM.YYYY format.
         """
         self.__birthday = Birthday(birthday)
+        Record._birthday_changes += 1
 
     @property
     def birthday(self):
@@ -135,6 +193,20 @@ class Record:
         """
         return self.__birthday.value if self.__birthday is not None else None
 
+    @property
+    def birthday_field(self):
+        """
+        Getter for the Birthday field object itself
+        """
+        return self.__birthday
+
+    @property
+    def phones(self):
+        """
+        Getter for the contact's Phone objects in insertion order
+        """
+        return self._slots.values()
+
     def add_phone(self, phone_number):
         """
         Adds a phone number to the contact.
@@ -142,7 +214,11 @@ class Record:
         Args:
             phone_number (str): The phone number to add.
         """
-        self.phones.append(Phone(phone_number))
+        if phone_number not in self._phones:
+            phone = _phone(phone_number)
+            self._phones[phone_number] = self._next_slot
+            self._slots[self._next_slot] = phone
+            self._next_slot += 1
 
     def remove_phone(self, phone_number):
         """
@@ -151,8 +227,9 @@ class Record:
         Args:
             phone_number (str): The phone number to remove.
         """
-        self.phones = [
-            phone for phone in self.phones if phone.value != phone_number]
+        slot = self._phones.pop(phone_number, None)
+        if slot is not None:
+            del self._slots[slot]
 
     def edit_phone(self, old_phone_number, new_phone_number):
         """
@@ -161,10 +238,18 @@ class Record:
         Args:
             old_phone_number (str): The phone number to be replaced.
             new_phone_number (str): The new phone number.
+
+        Raises:
+            ValueError: If the new phone number is invalid or already belongs to the contact.
         """
-        for phone in self.phones:
-            if phone.value == old_phone_number:
-                phone.value = new_phone_number
+        if old_phone_number not in self._phones or old_phone_number == new_phone_number:
+            return
+        if new_phone_number in self._phones:
+            raise ValueError("Phone number already exists for this contact")
+        new_phone = _phone(new_phone_number)
+        slot = self._phones.pop(old_phone_number)
+        self._phones[new_phone_number] = slot
+        self._slots[slot] = new_phone
 
     def find_phone(self, phone_number):
         """
@@ -176,13 +261,35 @@ class Record:
         Returns:
             str: The found phone number or None if not found.
         """
-        return next((phone.value for phone in self.phones if phone.value == phone_number), None)
+        return phone_number if phone_number in self._phones else None
+
+    def __getstate__(self):
+        # The birthday stays a date: "%Y" does not round-trip years below 1000
+        return self.name.value, [phone.value for phone in self.phones], self.birthday
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # Instance dict from pickles written before the compact state
+            legacy_birthday = state["_Record__birthday"]
+            state = (
+                state["name"].value,
+                [phone.value for phone in state["phones"]],
+                legacy_birthday.value if legacy_birthday is not None else None,
+            )
+        name, phones, birthday = state
+        self.name = Name(name)
+        self._phones = {}
+        self._slots = {}
+        self._next_slot = 0
+        for phone in phones:
+            self.add_phone(phone)
+        self.__birthday = Birthday(birthday) if birthday is not None else None
 
     def __str__(self):
         return f"Contact name: {self.name.value}, phones: {'; '.join(p.value for p in self.phones)}"
 
 
-class AddressBook(UserDict):
+class AddressBook(dict):
     """
     Represents an address book containing multiple records.
 
@@ -192,6 +299,43 @@ class AddressBook(UserDict):
         delete(name): Deletes a record by name.
     """
 
+    # Cached birthday index of the contacts with a birthday, see _birthday_index
+    _by_month_day = None
+    _indexed_records = None
+    _indexed_changes = -1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ("_by_month_day", "_indexed_records", "_indexed_changes"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        # Pickles written while AddressBook was a UserDict keep records in "data"
+        self.update(state.pop("data", {}))
+        self.__dict__.update(state)
+
+    def _birthday_index(self):
+        """
+        Returns (month * 32 + day, name) pairs of the contacts that have a
+        birthday, sorted for range lookups with bisect.
+
+        The index is rebuilt only when a record was added, replaced or removed
+        since the last call, or when any record's birthday changed. Comparing
+        the snapshot of the records is a C-level identity check per entry.
+        """
+        if self._indexed_changes != Record._birthday_changes or self._indexed_records != self:
+            by_month_day = []
+            for name, record in self.items():
+                birthday = record.birthday_field
+                if birthday is not None:
+                    by_month_day.append((birthday.month * 32 + birthday.day, name))
+            by_month_day.sort()
+            self._by_month_day = by_month_day
+            self._indexed_records = dict(self)
+            self._indexed_changes = Record._birthday_changes
+        return self._by_month_day
+
     def add_record(self, record):
         """
         Adds a record to the address book.
@@ -199,7 +343,7 @@ class AddressBook(UserDict):
         Args:
             record (Record): The record to add.
         """
-        self.data[record.name.value] = record
+        self[record.name.value] = record
 
     def find(self, name):
         """
@@ -211,7 +355,7 @@ class AddressBook(UserDict):
         Returns:
             Record: The found record or None if not found.
         """
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name):
         """
@@ -220,38 +364,50 @@ class AddressBook(UserDict):
         Args:
             name (str): The name of the contact.
         """
-        self.data.pop(name, None)
+        self.pop(name, None)
 
-    def get_upcoming_birthdays(self):
+    def get_upcoming_birthdays(self, today=None):
         """
         Determine upcoming birthdays within the next 7 days for a list of users.
 
-        :param users: List of dictionaries containing user information including name and birthday.
-        :return: Dictionary mapping user names to their upcoming birthdays formatted as "%d.%m.%Y".
+        :param today: Date to count the 7 days from; defaults to the current date.
+        :return: List of dictionaries with user names and their congratulation dates
+            formatted as "%d.%m.%Y".
         """
         upcoming_birthdays = []
-        current_date = datetime.today().date()
-
-        for user in self.data.keys():
-            user_birthday = self.data[user].birthday
-            if user_birthday is None:
-                continue
-            user_birthday = user_birthday.replace(
-                year=current_date.year)
-            # Check if the birthday is within the next 7 days and not in the past
-            if current_date < user_birthday <= current_date + timedelta(days=7):
-                # Adjust on Monday if birthday falls on a weekend (Saturday or Sunday)
-                if user_birthday.weekday() >= 5:
-                    user_birthday += timedelta(7-user_birthday.weekday())
-
-                upcoming_birthdays.append({
-                    "name": user,
-                    "congratulation_date:": user_birthday.strftime("%d.%m.%Y")
-                })
+        current_date = today if today is not None else datetime.today().date()
+        end_date = current_date + timedelta(days=7)
+        year = current_date.year
+        # Month and day are packed as month * 32 + day so they compare as plain ints
+        today_md = current_date.month * 32 + current_date.day
+        end_md = end_date.month * 32 + end_date.day
+        by_month_day = self._birthday_index()
+        # A 1-tuple sorts before every (month_day, name) pair with the same month_day
+        start = bisect_left(by_month_day, (today_md + 1,))
+        stop = bisect_left(by_month_day, (end_md + 1,))
+        # Select birthdays within the next 7 days and not in the past
+        if end_date.year != year:
+            in_window = by_month_day[start:] + by_month_day[:stop]
+        else:
+            in_window = by_month_day[start:stop]
+
+        for month_day, user in in_window:
+            month, day = divmod(month_day, 32)
+            user_birthday = date(year if month_day > today_md else year + 1, month, day)
+            # Adjust on Monday if birthday falls on a weekend (Saturday or Sunday)
+            weekday = user_birthday.weekday()
+            if weekday >= 5:
+                user_birthday += timedelta(7 - weekday)
+
+            upcoming_birthdays.append({
+                _NAME_KEY: user,
+                _DATE_KEY: user_birthday.strftime(_BDAY_FMT)
+            })
 
         return upcoming_birthdays
 
 
+@lru_cache(maxsize=128)
 def parse_input(user_input):
     """
     Parse user input into command and arguments.
@@ -297,14 +453,16 @@ def add_contact(args, contacts):
     """
     name, phone, *_ = args
     record = contacts.find(name)
-    message = "Contact updated."
     if record is None:
         record = Record(name)
         contacts.add_record(record)
-        message = "Contact added."
+        # A new record has no phones yet, so there is nothing to look up
+        if phone:
+            record.add_phone(phone)
+        return "Contact added."
     if phone and record.find_phone(phone) is None:
         record.add_phone(phone)
-    return message
+    return "Contact updated."
 
 
 @input_error
@@ -336,31 +494,51 @@ def change_contact(args, contacts):
     str: A message indicating the result of the operation.
     """
     name, old_phone, new_phone = args
-    contacts[name].edit_phone(old_phone, new_phone)
+    record = contacts[name]
+    if old_phone != new_phone and record.find_phone(new_phone) is not None:
+        return f"Error: Contact already has the phone number {new_phone}."
+    record.edit_phone(old_phone, new_phone)
     return "Contact updated"
 
 
+def _iter_all(contacts):
+    """
+    Yield the contacts table line by line.
+
+    Parameters:
+    contacts (dict): The contacts dictionary.
+
+    Yields:
+    str: Chunks of the formatted table.
+    """
+    separator = "\n" + "-" * 30 + "\n"
+    yield separator
+    yield f"{'Name':<15} {'Phone Number':<15}\n"
+    yield separator
+    for name, record in contacts.items():
+        for phone in record.phones:
+            yield f"{name:<15} {phone:<15}\n\n"
+
+
 @input_error
 def show_all(contacts):
     """
     Show all contacts in the contacts dictionary.
 
+    The table is streamed to stdout instead of being built in memory.
+
     Parameters:
     contacts (dict): The contacts dictionary.
 
     Returns:
-    str: A formatted string of all contacts.
+    str: An empty string once the table is written, or a message if there are no contacts.
     """
     if not contacts:
         return "No contacts found."
-    result = "\n" + "-" * 30 + "\n"
-    result += f"{'Name':<15} {'Phone Number':<15}\n"
-    result += "\n" + "-" * 30 + "\n"
-    for name, record in contacts.items():
-        for phone in record.phones:
-            result += f"{name:<15} {phone:<15}\n"
-            result += "\n"
-    return result
+    write = sys.stdout.write
+    for chunk in _iter_all(contacts):
+        write(chunk)
+    return ""
 
 
 @input_error
@@ -414,8 +592,8 @@ def save_data(book, filename="addressbook.pkl"):
     """
     Saves data into a file before closing the program
     """
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+    with open(filename, "wb", buffering=1 << 20) as f:
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_data(filename="addressbook.pkl"):
@@ -423,12 +601,25 @@ def load_data(filename="addressbook.pkl"):
     Loading data from the file during startup
     """
     try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
+        return pickle.loads(Path(filename).read_bytes())
     except FileNotFoundError:
         return AddressBook()
 
 
+COMMANDS_WITH_ARGS = {
+    "add": add_contact,
+    "phone": get_number,
+    "change": change_contact,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+}
+
+COMMANDS_NO_ARGS = {
+    "all": show_all,
+    "birthdays": birthdays,
+}
+
+
 def main():
     """
     Main function to run the assistant bot.
@@ -445,20 +636,10 @@ def main():
 
         if command == "hello":
             print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, contacts))
-        elif command == "phone":
-            print(get_number(args, contacts))
-        elif command == "change":
-            print(change_contact(args, contacts))
-        elif command == "all":
-            print(show_all(contacts))
-        elif command == "add-birthday":
-            print(add_birthday(args, contacts))
-        elif command == "show-birthday":
-            print(show_birthday(args, contacts))
-        elif command == "birthdays":
-            print(birthdays(contacts))
+        elif command in COMMANDS_WITH_ARGS:
+            print(COMMANDS_WITH_ARGS[command](args, contacts))
+        elif command in COMMANDS_NO_ARGS:
+            print(COMMANDS_NO_ARGS[command](contacts))
         else:
             print("Invalid command.")
     save_data(contacts)
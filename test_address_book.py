@@ -0,0 +1,345 @@
+"""
+Tests for the address_book module.
+"""
+
+import contextlib
+import copy
+from datetime import date, timedelta
+import os
+import pickle
+import io
+import tempfile
+import unittest
+
+from address_book import (
+    AddressBook, Record, change_contact, show_all, save_data, load_data
+)
+
+TODAY = date(2026, 10, 15)
+
+# AddressBook pickled by the original UserDict-based module: Ann (1234567890,
+# born 20.10.1990) and Bob (no phones or birthday)
+LEGACY_PICKLE = (
+    b'\x80\x04\x95\x0f\x01\x00\x00\x00\x00\x00\x00\x8c\x0caddress_book\x94\x8c\x0bAddressBook\x94\x93\x94)\x81\x94}\x94\x8c'
+    b'\x04data\x94}\x94(\x8c\x03Ann\x94h\x00\x8c\x06Record\x94\x93\x94)\x81\x94}\x94(\x8c\x04name\x94h\x00\x8c\x04Nam'
+    b'e\x94\x93\x94)\x81\x94}\x94\x8c\x05value\x94h\x07sb\x8c\x06phones\x94]\x94h\x00\x8c\x05Phone\x94\x93\x94)\x81\x94}'
+    b'\x94h\x11\x8c\n1234567890\x94sba\x8c\x11_Record__birthday\x94h\x00\x8c\x08Birth'
+    b'day\x94\x93\x94)\x81\x94}\x94h\x11\x8c\x08datetime\x94\x8c\x04date\x94\x93\x94C\x04\x07\xc6\n\x14\x94\x85\x94R\x94sbub'
+    b'\x8c\x03Bob\x94h\t)\x81\x94}\x94(h\x0ch\x0e)\x81\x94}\x94h\x11h$sbh\x12]\x94h\x19Nubusb.'
+)
+
+
+def make_record(name, birthday=None):
+    """
+    Creates a record with an optional birthday in DD.MM.YYYY format.
+    """
+    record = Record(name)
+    if birthday is not None:
+        record.add_birthday(birthday)
+    return record
+
+
+def upcoming_names(book, today=TODAY):
+    """
+    Returns the sorted names from get_upcoming_birthdays as seen on the given day.
+    """
+    return sorted(item["name"] for item in upcoming(book, today))
+
+
+def upcoming(book, today=TODAY):
+    """
+    Calls get_upcoming_birthdays as seen on the given day.
+    """
+    return book.get_upcoming_birthdays(today)
+
+
+def make_phones_record(*phones):
+    """
+    Creates a record named "E" with the given phone numbers.
+    """
+    record = Record("E")
+    for phone in phones:
+        record.add_phone(phone)
+    return record
+
+
+class RecordPhonesTest(unittest.TestCase):
+    """
+    Tests for the phone operations of Record.
+    """
+
+    def test_edit_keeps_position(self):
+        record = make_phones_record("1111111111", "2222222222", "3333333333")
+        record.edit_phone("2222222222", "9999999999")
+        self.assertEqual(str(record), "Contact name: E, phones: 1111111111; 9999999999; 3333333333")
+        self.assertIsNone(record.find_phone("2222222222"))
+        self.assertEqual(record.find_phone("9999999999"), "9999999999")
+
+    def test_edit_onto_existing_number_is_rejected(self):
+        record = make_phones_record("1111111111", "2222222222")
+        with self.assertRaises(ValueError):
+            record.edit_phone("1111111111", "2222222222")
+        self.assertEqual(str(record), "Contact name: E, phones: 1111111111; 2222222222")
+
+    def test_edit_to_same_number_is_a_no_op(self):
+        record = make_phones_record("1111111111", "2222222222")
+        record.edit_phone("1111111111", "1111111111")
+        self.assertEqual(str(record), "Contact name: E, phones: 1111111111; 2222222222")
+
+    def test_edit_with_invalid_number_keeps_record(self):
+        record = make_phones_record("1111111111")
+        with self.assertRaises(ValueError):
+            record.edit_phone("1111111111", "123")
+        self.assertEqual(record.find_phone("1111111111"), "1111111111")
+
+    def test_remove_then_add_appends(self):
+        record = make_phones_record("1111111111", "2222222222")
+        record.remove_phone("1111111111")
+        record.add_phone("1111111111")
+        self.assertEqual(str(record), "Contact name: E, phones: 2222222222; 1111111111")
+
+    def test_change_contact_reports_duplicate(self):
+        book = AddressBook()
+        book.add_record(make_phones_record("1111111111", "2222222222"))
+        self.assertEqual(
+            change_contact(["E", "1111111111", "2222222222"], book),
+            "Error: Contact already has the phone number 2222222222.",
+        )
+        self.assertEqual(change_contact(["E", "1111111111", "3333333333"], book), "Contact updated")
+        self.assertEqual(str(book["E"]), "Contact name: E, phones: 3333333333; 2222222222")
+
+
+class BirthdayIndexSyncTest(unittest.TestCase):
+    """
+    Every way of changing the book or its records keeps the birthday lookup correct.
+    """
+
+    def test_record_birthday_added_after_insert(self):
+        book = AddressBook()
+        record = Record("X")
+        book.add_record(record)
+        self.assertEqual(upcoming_names(book), [])
+        record.add_birthday("16.10.1990")
+        self.assertEqual(upcoming_names(book), ["X"])
+
+    def test_constructor_and_item_assignment(self):
+        self.assertEqual(upcoming_names(AddressBook({"Y": make_record("Y", "16.10.1990")})), ["Y"])
+        book = AddressBook()
+        self.assertEqual(upcoming_names(book), [])
+        book["Y"] = make_record("Y", "16.10.1990")
+        self.assertEqual(upcoming_names(book), ["Y"])
+        book.update({"Z": make_record("Z", "17.10.1990")})
+        self.assertEqual(upcoming_names(book), ["Y", "Z"])
+
+    def test_replacing_record(self):
+        book = AddressBook()
+        old = make_record("Z", "16.10.1990")
+        book["Z"] = old
+        self.assertEqual(upcoming_names(book), ["Z"])
+        book["Z"] = make_record("Z")
+        self.assertEqual(upcoming_names(book), [])
+
+    def test_removal_paths(self):
+        for remove in (
+            lambda book: book.pop("Y"),
+            lambda book: book.__delitem__("Y"),
+            lambda book: book.popitem(),
+            lambda book: book.clear(),
+            lambda book: book.delete("Y"),
+        ):
+            book = AddressBook()
+            book["Y"] = make_record("Y", "16.10.1990")
+            self.assertEqual(upcoming_names(book), ["Y"])
+            remove(book)
+            self.assertEqual(upcoming_names(book), [])
+
+    def test_setdefault_and_fromkeys(self):
+        book = AddressBook()
+        book.setdefault("A", make_record("A", "16.10.1990"))
+        self.assertEqual(upcoming_names(book), ["A"])
+        book.setdefault("x")
+        self.assertIsNone(book["x"])
+        self.assertEqual(sorted(AddressBook.fromkeys(["a", "b"])), ["a", "b"])
+
+    def test_copies_are_independent(self):
+        for copy_book in (copy.copy, copy.deepcopy):
+            book = AddressBook()
+            book.add_record(make_record("A"))
+            self.assertEqual(upcoming_names(book), [])
+            copied = copy_book(book)
+            self.assertEqual(upcoming_names(copied), [])
+
+            book["A"].add_birthday("16.10.1990")
+            self.assertEqual(upcoming_names(book), ["A"])
+            copied.add_record(make_record("B", "17.10.1990"))
+            self.assertEqual(upcoming_names(copied), ["A", "B"] if copy_book is copy.copy else ["B"])
+            self.assertEqual(upcoming_names(book), ["A"])
+
+    def test_record_in_two_books(self):
+        record = make_record("A")
+        first, second = AddressBook(), AddressBook()
+        first.add_record(record)
+        second.add_record(record)
+        self.assertEqual((upcoming_names(first), upcoming_names(second)), ([], []))
+        record.add_birthday("16.10.1990")
+        self.assertEqual((upcoming_names(first), upcoming_names(second)), (["A"], ["A"]))
+
+
+class UpcomingBirthdaysTest(unittest.TestCase):
+    """
+    Tests for AddressBook.get_upcoming_birthdays.
+    """
+
+    def test_window_excludes_today_and_includes_seventh_day(self):
+        book = AddressBook()
+        for name, birthday in (
+            ("today", "15.10.1990"),
+            ("tomorrow", "16.10.1990"),
+            ("seventh", "22.10.1990"),
+            ("eighth", "23.10.1990"),
+        ):
+            book.add_record(make_record(name, birthday))
+        self.assertEqual(upcoming_names(book), ["seventh", "tomorrow"])
+
+    def test_weekend_moves_to_monday(self):
+        book = AddressBook()
+        book.add_record(make_record("saturday", "17.10.1990"))
+        book.add_record(make_record("sunday", "18.10.1990"))
+        self.assertEqual(upcoming(book), [
+            {"name": "saturday", "congratulation_date": "19.10.2026"},
+            {"name": "sunday", "congratulation_date": "19.10.2026"},
+        ])
+
+    def test_window_wraps_into_next_year(self):
+        book = AddressBook()
+        for name, birthday in (
+            ("dec", "31.12.1990"),
+            ("jan", "01.01.1990"),
+            ("seventh", "05.01.1990"),
+            ("eighth", "06.01.1990"),
+        ):
+            book.add_record(make_record(name, birthday))
+        self.assertEqual(upcoming(book, date(2026, 12, 29)), [
+            {"name": "dec", "congratulation_date": "31.12.2026"},
+            {"name": "jan", "congratulation_date": "01.01.2027"},
+            {"name": "seventh", "congratulation_date": "05.01.2027"},
+        ])
+
+    def test_matches_day_by_day_reference(self):
+        book = AddressBook()
+        for month in range(1, 13):
+            for day in (1, 10, 28):
+                book.add_record(make_record(f"{day:02}.{month:02}", f"{day:02}.{month:02}.1990"))
+        for offset in range(0, 366, 3):
+            today = date(2026, 1, 1) + timedelta(days=offset)
+            expected = sorted(
+                name for name, record in book.items()
+                if any(
+                    (today + timedelta(days=ahead)).strftime("%m%d")
+                    == record.birthday.strftime("%m%d")
+                    for ahead in range(1, 8)
+                )
+            )
+            self.assertEqual(upcoming_names(book, today), expected, today)
+
+    def test_index_after_delete_and_new_birthday(self):
+        book = AddressBook()
+        book.add_record(make_record("A", "16.10.1990"))
+        book.add_record(make_record("B", "16.10.1990"))
+        self.assertEqual(upcoming_names(book), ["A", "B"])
+        book.delete("A")
+        self.assertEqual(upcoming_names(book), ["B"])
+        book["B"].add_birthday("01.01.1990")
+        self.assertEqual(upcoming_names(book), [])
+        book["B"].add_birthday("20.10.1990")
+        self.assertEqual(upcoming_names(book), ["B"])
+
+
+class ShowAllTest(unittest.TestCase):
+    """
+    Tests for the show_all command.
+    """
+
+    def test_printed_table_matches_previous_output(self):
+        book = AddressBook()
+        book.add_record(make_phones_record("1234567890", "1111111111"))
+        book.add_record(Record("NoPhones"))
+        bob = Record("Bob")
+        bob.add_phone("2222222222")
+        book.add_record(bob)
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            print(show_all(book))
+
+        # The string show_all used to return, followed by print's newline
+        separator = "\n" + "-" * 30 + "\n"
+        expected = (
+            separator
+            + "Name            Phone Number   \n"
+            + separator
+            + "E               1234567890     \n\n"
+            + "E               1111111111     \n\n"
+            + "Bob             2222222222     \n\n"
+            + "\n"
+        )
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_empty_book(self):
+        self.assertEqual(show_all(AddressBook()), "No contacts found.")
+
+
+class PickleTest(unittest.TestCase):
+    """
+    Tests for saving and loading the address book.
+    """
+
+    def test_round_trip(self):
+        book = AddressBook()
+        record = make_record("Ann", "16.10.1990")
+        record.add_phone("1234567890")
+        book.add_record(record)
+        book.add_record(make_record("Bob"))
+
+        loaded = pickle.loads(pickle.dumps(book, protocol=pickle.HIGHEST_PROTOCOL))
+
+        self.assertIsInstance(loaded, AddressBook)
+        self.assertEqual(str(loaded["Ann"]), "Contact name: Ann, phones: 1234567890")
+        self.assertEqual(loaded["Ann"].birthday, date(1990, 10, 16))
+        self.assertIsNone(loaded["Bob"].birthday)
+        self.assertEqual(upcoming_names(loaded), ["Ann"])
+        loaded["Bob"].add_birthday("17.10.1990")
+        self.assertEqual(upcoming_names(loaded), ["Ann", "Bob"])
+
+    def test_round_trip_year_below_1000(self):
+        book = AddressBook()
+        book.add_record(make_record("Old", "01.01.0999"))
+
+        loaded = pickle.loads(pickle.dumps(book, protocol=pickle.HIGHEST_PROTOCOL))
+
+        self.assertEqual(loaded["Old"].birthday, date(999, 1, 1))
+
+    def test_save_and_load_data(self):
+        book = AddressBook()
+        book.add_record(make_record("Ann", "16.10.1990"))
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "addressbook.pkl")
+            save_data(book, filename)
+            self.assertEqual(load_data(filename)["Ann"].birthday, date(1990, 10, 16))
+            self.assertEqual(len(load_data(os.path.join(tmp, "missing.pkl"))), 0)
+
+    def test_legacy_pickle(self):
+        book = pickle.loads(LEGACY_PICKLE)
+
+        self.assertIsInstance(book, AddressBook)
+        self.assertEqual(sorted(book), ["Ann", "Bob"])
+        self.assertEqual(book["Ann"].find_phone("1234567890"), "1234567890")
+        self.assertEqual(book["Ann"].birthday, date(1990, 10, 20))
+        self.assertIsNone(book["Bob"].birthday)
+        self.assertEqual(upcoming_names(book, date(2026, 10, 18)), ["Ann"])
+        book["Bob"].add_birthday("19.10.1990")
+        self.assertEqual(upcoming_names(book, date(2026, 10, 18)), ["Ann", "Bob"])
+
+
+if __name__ == "__main__":
+    unittest.main()